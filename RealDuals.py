@@ -1,6 +1,15 @@
 from typing import Self, List, Tuple, Set
-import matplotlib.pyplot as plt
 import math 
+import numpy as np
+
+def _math_for(value: float | np.ndarray):
+    # Elementwise functions come from numpy for arrays, the cheaper math module otherwise
+    return np if isinstance(value, np.ndarray) else math
+
+def _dpow_int(ar: float, ad: float, n: int) -> Tuple[float, float]:
+    # One power call shared by the real and dual parts
+    rn1 = ar ** (n - 1)
+    return rn1 * ar, n * rn1 * ad
 
 def main():
     number: RealDual = RealDual(1, 1)
@@ -14,6 +23,11 @@ class RealDual:
     The real part is a, and the dual part is b.
     """
 
+    __slots__ = ("_real", "_dual")
+
+    # Make numpy defer to our reflected operators, e.g. np.ndarray + RealDual
+    __array_ufunc__ = None
+
     def __init__(self, real: float, dual: float):
         self._real: float = real
         self._dual: float = dual
@@ -26,6 +40,15 @@ class RealDual:
     def dual(self) -> float:
         return self._dual
 
+    @classmethod
+    def seed(cls, xs: np.ndarray) -> Self:
+        """
+        Dual number over an array of inputs with unit dual parts, so that
+        evaluating a function on it yields all values and derivatives at once.
+        """
+        xs = np.asarray(xs, dtype=float)
+        return cls(xs, np.ones_like(xs))
+
     @staticmethod
     def check(maybe_dual_number: Self | any) -> Self:
         if isinstance(maybe_dual_number, RealDual):
@@ -38,48 +61,98 @@ class RealDual:
             raise ValueError("Not a dual number")
 
     def __neg__(self) -> Self:
-        return RealDual(-self.real, -self.dual)
+        return RealDual(-self._real, -self._dual)
 
     def __pos__(self) -> Self:
-        return RealDual(self.real, self.dual)
+        return RealDual(self._real, self._dual)
     
     def conjugate(self) -> Self:
-        return RealDual(self.real, -self.dual)
+        return RealDual(self._real, -self._dual)
     
     def reciprocate(self) -> Self:
-        if self.real == 0:
+        zero = (self._real == 0).any() if isinstance(self._real, np.ndarray) else self._real == 0
+        if zero:
             raise ZeroDivisionError("division by RealDual with zero real component")
-        return self.conjugate() * (1 / self.real ** 2)
+        # (a + bε)^-1 = 1/a - (b/a^2)ε
+        inv = 1.0 / self._real
+        return RealDual(inv, -self._dual * inv * inv)
 
     def __add__(self, other: Self | any) -> Self:
-        other: Self = RealDual.check(other)
-        return RealDual(self.real + other.real, self.dual + other.dual)
+        if other.__class__ is RealDual:
+            return RealDual(self._real + other._real, self._dual + other._dual)
+        if isinstance(other, (int, float, np.ndarray)):
+            return RealDual(self._real + other, self._dual)
+        return NotImplemented
     
-    __radd__ = __add__
+    def __radd__(self, other: Self | any) -> Self:
+        if isinstance(other, (int, float, np.ndarray)):
+            return RealDual(self._real + other, self._dual)
+        return NotImplemented
+
+    def __sub__(self, other: Self | any) -> Self:
+        if other.__class__ is RealDual:
+            return RealDual(self._real - other._real, self._dual - other._dual)
+        if isinstance(other, (int, float, np.ndarray)):
+            return RealDual(self._real - other, self._dual)
+        return NotImplemented
+
+    def __rsub__(self, other: Self | any) -> Self:
+        return -self + other
     
     def __mul__(self, other: Self | any) -> Self:
-        other: Self = RealDual.check(other)
-        return RealDual(self.real * other.real, other.real * self.dual + self.real * other.dual)
+        if other.__class__ is RealDual:
+            return RealDual(self._real * other._real, other._real * self._dual + self._real * other._dual)
+        if isinstance(other, (int, float, np.ndarray)):
+            return RealDual(self._real * other, self._dual * other)
+        return NotImplemented
     
-    __rmul__ = __mul__
+    def __rmul__(self, other: Self | any) -> Self:
+        if isinstance(other, (int, float, np.ndarray)):
+            return RealDual(self._real * other, self._dual * other)
+        return NotImplemented
 
     def __truediv__(self, denominator: Self | any) -> Self:
-        denominator: Self = RealDual.check(denominator)
-        return self * denominator.reciprocate()
+        if denominator.__class__ is RealDual:
+            return self * denominator.reciprocate()
+        if isinstance(denominator, (int, float, np.ndarray)):
+            return RealDual(self._real / denominator, self._dual / denominator)
+        return NotImplemented
 
     def __rtruediv__(self, numerator: Self | any) -> Self:
-        numerator: Self = RealDual.check(numerator)
-        return numerator / self
+        if isinstance(numerator, (int, float, np.ndarray)):
+            return RealDual(numerator, 0.0) * self.reciprocate()
+        return NotImplemented
 
     def __pow__(self, power: Self | any) -> Self:
+        # Integer powers are plain products for either sign of the base, no logarithm needed
+        if isinstance(power, (int, float)) and float(power).is_integer():
+            n = int(power)
+            if n == 0:
+                if isinstance(self._real, np.ndarray):
+                    return RealDual(np.ones_like(self._real, dtype=float), np.zeros_like(self._dual, dtype=float))
+                return RealDual(1.0, 0.0)
+            if n < 0:
+                return self.reciprocate() ** -n
+            if isinstance(self._real, np.ndarray):
+                real, dual = _dpow_int(self._real, self._dual, n)
+            else:
+                real, dual = _dpow_int(float(self._real), float(self._dual), n)
+            return RealDual(real, dual)
         power: Self = RealDual.check(power)
-        if self.real > 0:
-            return RealDual(self.real ** power.real, self.real ** (power.real - 1) * power.real * self.dual + self.real ** power.real * power.dual * math.log(self.real))
-        elif self.real < 0:
-            if power.dual == 0 and power.real.is_integer():
-                if power.real < 0 and self.real == 0:
+        if isinstance(self._real, np.ndarray):
+            real = self._real ** power._real
+            dual = power._real * self._real ** (power._real - 1) * self._dual
+            if power._dual != 0:
+                dual = dual + real * power._dual * np.log(self._real)
+            return RealDual(real, dual)
+        if self._real > 0:
+            return RealDual(self._real ** power._real, self._real ** (power._real - 1) * power._real * self._dual + self._real ** power._real * power._dual * math.log(self._real))
+        elif self._real < 0:
+            if power._dual == 0 and power._real.is_integer():
+                if power._real < 0 and self._real == 0:
                     raise ValueError("Cannot reciprocate a dual number with zero real component")
-                return RealDual(self.real ** power.real, self.real ** (power.real - 1) * power.real * self.dual)
+                real, dual = _dpow_int(float(self._real), float(self._dual), int(power._real))
+                return RealDual(real, dual)
         raise ValueError(f"{self:s} ** {power:s} cannot be performed")
 
     def __rpow__(self, base: Self | any) -> Self:
@@ -91,23 +164,36 @@ class RealDual:
         return base ** self
     
     def sin(self) -> Self:
-        return RealDual(math.sin(self.real), self.dual * math.cos(self.real))
+        lib = _math_for(self._real)
+        return RealDual(lib.sin(self._real), self._dual * lib.cos(self._real))
     
     def cos(self) -> Self:
-        return RealDual(math.cos(self.real), -self.dual * math.sin(self.real))
+        lib = _math_for(self._real)
+        return RealDual(lib.cos(self._real), -self._dual * lib.sin(self._real))
 
     def __eq__(self, other: Self | any) -> bool:
-        other = RealDual.check(other)
-        return self.real == other.real and self.dual == other.dual
+        if self is other:
+            return True
+        if other.__class__ is RealDual:
+            return self._real == other._real and self._dual == other._dual
+        if isinstance(other, (int, float)):
+            return self._real == other and self._dual == 0
+        return NotImplemented
     
     def __neq__(self, other: Self | any) -> bool:
         return not self.__eq__(other)
 
+    def __hash__(self) -> int:
+        # A dual with no dual part equals its real part, so it has to hash like it too
+        if self._dual == 0:
+            return hash(self._real)
+        return hash((self._real, self._dual))
+
     def __repr__(self) -> str:
         return f"Dual({self._real}, {self._dual})" 
     
     def __str__(self) -> str:
-        if self.dual == 1:
+        if not isinstance(self._dual, np.ndarray) and self._dual == 1:
             return f"{self._real} + ε"
         return f"{self._real} + {self._dual}ε"
 
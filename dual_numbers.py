@@ -1,13 +1,172 @@
 from manim import *
 import math
+import numpy as np
+import os
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from manim.utils.tex_file_writing import delete_nonsvg_files
+from RealDuals import RealDual
+
+# Compiling LaTeX dominates building these scenes, so each distinct expression is compiled once
+# and copies are handed out, since mobjects get moved and transformed after construction
+@lru_cache(maxsize=None)
+def _tex_proto(tex_class: type[Tex], *parts: str, scale: float = 1.0) -> Tex:
+    return tex_class(*parts).scale(scale)
+
+def MTex(*parts: str, scale: float = 1.0) -> MathTex:
+    return _tex_proto(MathTex, *parts, scale=scale).copy()
+
+def TTex(*parts: str, scale: float = 1.0) -> Tex:
+    return _tex_proto(Tex, *parts, scale=scale).copy()
+
+# Every expression the scene builds through MTex/TTex, as (class, parts, scale) cache keys.
+# They are independent, so they can all be compiled in parallel before the first frame
+_TEX_PREWARM = (
+    (MathTex, ("x",), 0.8),
+    (MathTex, ("y",), 0.8),
+    (MathTex, ("f'(x_0)=",), 0.9),
+    (MathTex, (r"\varepsilon",), 1.0),
+    (MathTex, (r"\varepsilon^2",), 1.0),
+    (MathTex, (r"\varepsilon^2 = 0",), 1.0),
+    (MathTex, (r"a + b \cdot \varepsilon",), 1.0),
+    (MathTex, (r"(3 + 4 \varepsilon)\cdot(2 + 1 \varepsilon)",), 1.2),
+    (MathTex, (
+        r"(3 + 4 \varepsilon)\cdot(2 + 1 \varepsilon)",
+        r"=",
+        r"3\cdot 2",
+        r"+",
+        r"3\cdot 1\varepsilon",
+        r"+",
+        r"4\varepsilon\cdot 2",
+        r"+",
+        r"4\varepsilon\cdot 1\varepsilon",
+    ), 1.0),
+    (MathTex, (
+        r"(3 + 4 \varepsilon)\cdot(2 + 1 \varepsilon)",
+        r"=",
+        r"6",
+        r"+",
+        r"3\varepsilon",
+        r"+",
+        r"8\varepsilon",
+        r"+",
+        r"4\varepsilon^2",
+    ), 1.0),
+    (MathTex, (
+        r"(3 + 4 \varepsilon)\cdot(2 + 1 \varepsilon)",
+        r"=",
+        r"6",
+        r"+",
+        r"11\varepsilon",
+        r"+",
+        r"4\varepsilon^2",
+    ), 1.0),
+    (MathTex, (r"\frac{1}{a + b \varepsilon}",), 1.2),
+    (MathTex, (
+        r"\frac{1}{a + b \varepsilon}",
+        r"=",
+        r"\frac{1}{a + b \varepsilon}\cdot\frac{a - b \varepsilon}{a - b \varepsilon}",
+    ), 1.0),
+    (MathTex, (
+        r"\frac{1}{a + b \varepsilon}",
+        r"=",
+        r"\frac{a - b \varepsilon}{a^2 - (b \varepsilon)^2}",
+    ), 1.0),
+    (MathTex, (r"\frac{1}{a + b \varepsilon}", r"=", r"\frac{a - b \varepsilon}{a^2}"), 1.0),
+    (MathTex, (r"a \neq 0",), 1.0),
+    (MathTex, (
+        r"\mathbb{D} = \{ a + b \varepsilon \mid a, b \in \mathbb{R} \} = \{ \text{Dual numbers} \}",
+    ), 0.9),
+    (MathTex, (r"f : \mathbb{R} \to \mathbb{R}, \,", r"f(x) = x^2 + 3x + 5"), 1.0),
+    (MathTex, (r"f : \mathbb{D} \to \mathbb{D}, \,", r"f(u) = u^2 + 3u + 5"), 1.0),
+    (MathTex, (r"f(x + \varepsilon) = ", r"(x + \varepsilon)^2 + 3(x + \varepsilon) + 5"), 1.0),
+    (MathTex, (
+        r"f(x + \varepsilon) = ",
+        r"x^2 + 2x\varepsilon + \varepsilon^2 + 3x + 3\varepsilon + 5",
+    ), 1.0),
+    (MathTex, (
+        r"f(x + \varepsilon) = ",
+        r"(x^2 + 3x + 5) + (2x + 3)\cdot \varepsilon",
+        r"+",
+        r"\varepsilon^2",
+    ), 1.0),
+    (MathTex, (r"f(x + \varepsilon) =", r"f(x) + f^\prime(x)\,\varepsilon"), 1.0),
+    (MathTex, (r"p(x) &= \sum_{i=0}^n a_i \, x^i",), 1.0),
+    (MathTex, (r"p(x + \varepsilon) &= p(x) + p'(x)\,\varepsilon",), 1.0),
+    (MathTex, (r"p(x + \varepsilon)", r"=", r"\sum_{i = 0}^n a_i\,(x + \varepsilon)^i"), 1.0),
+    (MathTex, (
+        r"p(x + \varepsilon)",
+        r"=",
+        r"\sum_{i = 0}^n a_i \sum_{k = 0}^{i} \binom{i}{k} x^{\,i-k}\varepsilon^{k}",
+    ), 1.0),
+    (Tex, (r"$\varepsilon^2 = 0\ \Rightarrow\ k\ge 2 \text{ terms vanish}$",), 0.7),
+    (MathTex, (
+        r"p(x + \varepsilon)",
+        r"=",
+        r"\sum_{i = 0}^n a_i \Big(x^i + i\,x^{\,i-1}\varepsilon\Big)",
+    ), 1.0),
+    (MathTex, (
+        r"p(x + \varepsilon)",
+        r"=",
+        r"\sum_{i=0}^n a_i x^i",
+        r"+",
+        r"\varepsilon \sum_{i=0}^n i\,a_i\,x^{\,i-1}",
+    ), 1.0),
+    (MathTex, (r"p(x+\varepsilon)", r"=", r"p(x)", r"+", r"p'(x)\,\varepsilon"), 1.0),
+    (MathTex, (r"\square",), 0.9),
+)
+
+def prewarm_tex():
+    """
+    Fill the expression cache up front, running the LaTeX builds in parallel.
+    LaTeX runs as a subprocess, so threads are enough to overlap them.
+    """
+    # After every compile manim deletes all non-SVG files in tex_dir, including the .dvi and .log
+    # files other threads are still working on, so cleanup is held off until the pool is done
+    no_latex_cleanup = config.no_latex_cleanup
+    config.no_latex_cleanup = True
+    try:
+        with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+            list(executor.map(lambda key: _tex_proto(key[0], *key[1], scale=key[2]), _TEX_PREWARM))
+    finally:
+        config.no_latex_cleanup = no_latex_cleanup
+    if not no_latex_cleanup:
+        delete_nonsvg_files()
+
+# Easing for the tangent sweep, out to the far end and back to the middle. Tabulated once so the
+# per-frame rate function is a single interpolation rather than a branch and a cosine
+_SWEEP_T = np.linspace(0, 1, 1024)
+_SWEEP_R = np.where(
+    _SWEEP_T < 1 / 2,
+    0.5 - 0.5 * np.cos(2 * PI * _SWEEP_T),
+    0.75 - 0.25 * np.cos(2 * PI * _SWEEP_T)
+)
+
+def sweep_rate(t: float | np.ndarray) -> float | np.ndarray:
+    return np.interp(t, _SWEEP_T, _SWEEP_R)
+
+def write_in(mobject: Mobject, fast: bool = False) -> Animation:
+    """
+    Write the mobject in, or for low quality previews fade it in over the same
+    run time, as drawing every glyph stroke by stroke is slow to rasterise.
+    """
+    if fast or config.quality == "low_quality":
+        # Same default run time Write picks, without building the Write and its outline copy
+        run_time = 1 if len(mobject.family_members_with_points()) < 15 else 2
+        return FadeIn(mobject, run_time=run_time)
+    return Write(mobject)
 
 class DualNumbersAnimation(Scene):
     def construct(self):
+        prewarm_tex()
         self.derivative_showcase_0()
         self.explore_dual_numbers_1()
         self.finding_derivative_2()
         self.exercise_3()
 
+    def show(self, *mobjects: Mobject, fast: bool = False):
+        self.play(*(write_in(mobject, fast) for mobject in mobjects))
+
     def derivative_showcase_0(self):
         axes = Axes(
             x_range=[-6, 6, 1],
@@ -17,110 +176,139 @@ class DualNumbersAnimation(Scene):
             tips=False,
         ).to_edge(DOWN)
 
-        x_label = axes.get_x_axis_label(MathTex("x").scale(0.8))
-        y_label = axes.get_y_axis_label(MathTex("y").scale(0.8))
+        x_label = axes.get_x_axis_label(MTex("x", scale=0.8))
+        y_label = axes.get_y_axis_label(MTex("y", scale=0.8))
 
         x_min, x_max = -6, 6 # maximum and minimum values of x on axis
         delta = 0.6 # delta such that you're actually on the axes
 
-        # The function
-        def g(x: float) -> float:
-            return 0.25 * x ** 3 - x + 1
+        # The function 0.25x^3 - x + 1 in Horner form, works on both floats and RealDuals
+        def g(x: float | RealDual) -> float | RealDual:
+            return ((0.25 * x) * x - 1) * x + 1
         
         # Scaled version to look nicer
         def f(x: float) -> float:
             return g(x / 2)
 
-        graph = axes.plot(f, x_range=[x_min + delta / 2, x_max - delta / 2], color=BLUE)
+        # Exact f(x) + f'(x)ε in a single pass, the 0.5 is the chain rule factor of x / 2
+        def f_dual(x: float) -> RealDual:
+            return g(RealDual(x / 2, 0.5))
 
-        self.play(
-            Create(axes),
-            FadeIn(x_label, y_label)
+        # f and f' tabulated once over the whole axis in one vectorised pass, looked up per frame
+        xs = np.linspace(x_min, x_max, 4096)
+        table = f_dual(xs)
+
+        def f_and_fprime(x: float) -> tuple[float, float]:
+            return np.interp(x, xs, table.real), np.interp(x, xs, table.dual)
+
+        # g only uses + and *, so the whole curve can be sampled in a single numpy call
+        graph = axes.plot(
+            f, x_range=[x_min + delta / 2, x_max - delta / 2], use_vectorized=True, color=BLUE
         )
-        self.play(Create(graph))
 
         x0 = ValueTracker(x_min + delta)
 
-        # Numerical derivative (central difference)
-        def fprime_numeric(x: float, h: float = 1e-10) -> float:
-            return (f(x + h) - f(x - h)) / (2 * h)
+        # f and f' at x0, recomputed only when x0 has moved so all updaters in a frame share one lookup
+        state = {"x": None, "y": None, "m": None}
 
-        dot = always_redraw(
-            lambda: Dot(axes.c2p(x0.get_value(), f(x0.get_value())), color=YELLOW)
-        )
-
-        # This is the tangent line area
-        def tangent_line_mobject():
+        def sample() -> dict:
             x_ = x0.get_value()
-            m = fprime_numeric(x_)
-            y_ = f(x_)
-            x_delta = 1 / math.sqrt(1 + m ** 2)
-            xa, xb = x_ - x_delta, x_ + x_delta
-            p1 = axes.c2p(xa, y_ - m * x_delta)
-            p2 = axes.c2p(xb, y_ + m * x_delta)
-            return Line(p1, p2, color=ORANGE, stroke_width=6)
+            if state["x"] != x_:
+                state["x"] = x_
+                state["y"], state["m"] = f_and_fprime(x_)
+            return state
 
-        tangent_line = always_redraw(tangent_line_mobject)
+        # The dot and tangent line are moved in place each frame rather than rebuilt
+        def update_dot(dot: Dot):
+            s = sample()
+            dot.move_to(axes.c2p(s["x"], s["y"]))
+
+        dot = Dot(color=YELLOW)
+        dot.add_updater(update_dot, call_updater=True)
+
+        # This is the tangent line area
+        def update_tangent_line(line: Line):
+            s = sample()
+            x_, y_, m = s["x"], s["y"], s["m"]
+            # Unit direction (dx, dy) along the tangent
+            dx = 1.0 / math.hypot(1.0, m)
+            dy = m * dx
+            p1 = axes.c2p(x_ - dx, y_ - dy)
+            p2 = axes.c2p(x_ + dx, y_ + dy)
+            line.put_start_and_end_on(p1, p2)
+
+        tangent_line = Line(LEFT, RIGHT, color=ORANGE, stroke_width=6)
+        tangent_line.add_updater(update_tangent_line, call_updater=True)
 
         # This is doing the shit on the top left
         slope_value = DecimalNumber(0, num_decimal_places=2)
-        slope_label = VGroup(MathTex("f'(x_0)=").scale(0.9), slope_value).arrange(RIGHT, buff = 0.1)
-        slope_label.add_updater(lambda m: m.to_corner(UL).to_corner(UL).shift(RIGHT*0.4 + DOWN*0.3))
-        slope_value.add_updater(lambda d: d.set_value(fprime_numeric(x0.get_value())))
+        slope_label = VGroup(MTex("f'(x_0)=", scale=0.9), slope_value).arrange(RIGHT, buff = 0.1)
+        slope_label.to_corner(UL).shift(RIGHT*0.4 + DOWN*0.3)
+        slope_value.add_updater(lambda d: d.set_value(sample()["m"]))
         
-        self.play(
-            FadeIn(tangent_line), 
-            FadeIn(dot), 
-            FadeIn(slope_label)
-        )
-
-        self.play(x0.animate.set_value(x_max - delta), 
-                    run_time=17, 
-                    rate_func=
-                        lambda t: 
-                            0.5 - 0.5 * math.cos(2 * PI * t) 
-                                if t < 1 / 2 
-                                else 0.75 - 0.25 * math.cos(2 * PI * t)
-                    )
+        # Back to back steps with no pause between them are played as one Succession, same timing
+        # but a single partial movie file to encode
+        self.play(Succession(
+            AnimationGroup(Create(axes), FadeIn(x_label, y_label)),
+            Create(graph),
+            AnimationGroup(FadeIn(tangent_line), FadeIn(dot), FadeIn(slope_label))
+        ))
+
+        # The sweep is deterministic, so x0, f and f' are worked out for every frame of it up front
+        # and each frame just indexes into them
+        sweep_time = 17
+        n_frames = int(sweep_time * config.frame_rate) + 1
+        x_start, x_end = x_min + delta, x_max - delta
+        x_frames = x_start + sweep_rate(np.linspace(0, 1, n_frames)) * (x_end - x_start)
+        frames = f_dual(x_frames)
+
+        def sweep_to_frame(tracker: ValueTracker, alpha: float):
+            i = round(alpha * (n_frames - 1))
+            if not 0 <= i < n_frames:
+                # Off the precomputed frames, fall back to the rate function and the table lookup
+                tracker.set_value(x_start + sweep_rate(alpha) * (x_end - x_start))
+                return
+            tracker.set_value(x_frames[i])
+            state["x"], state["y"], state["m"] = tracker.get_value(), frames.real[i], frames.dual[i]
+
+        self.play(UpdateFromAlphaFunc(x0, sweep_to_frame), run_time=sweep_time, rate_func=linear)
         self.wait(2)
-        self.play(
-            FadeOut(tangent_line),
-            FadeOut(dot), 
-            FadeOut(slope_label),
-            FadeOut(graph),
-            FadeOut(axes),
-            FadeOut(x_label, y_label)
-        )
+        everything = VGroup(tangent_line, dot, slope_label, graph, axes, x_label, y_label)
+        self.play(FadeOut(everything))
         self.wait(6)
     
     def explore_dual_numbers_1(self):
-        varepsilon: MathTex = MathTex(r"\varepsilon")
-        varepsilon_squared: MathTex = MathTex(r"\varepsilon^2")
-        varepsilon_square_equals_0: MathTex = MathTex(r"\varepsilon^2 = 0")
-        generalised_dual_number: MathTex = MathTex(r"a + b \cdot \varepsilon")
+        varepsilon: MathTex = MTex(r"\varepsilon")
+        varepsilon_squared: MathTex = MTex(r"\varepsilon^2")
+        varepsilon_square_equals_0: MathTex = MTex(r"\varepsilon^2 = 0")
+        generalised_dual_number: MathTex = MTex(r"a + b \cdot \varepsilon")
 
         self.play(
             FadeIn(varepsilon)
         )
         self.wait(0.5)
+        # Each step shares glyphs with the previous one, so matching glyphs just move into place
+        # and the source is replaced rather than kept around as a morphed copy
         self.play(
-            Transform(varepsilon, varepsilon_squared)
+            TransformMatchingShapes(varepsilon, varepsilon_squared)
         )
-        self.play(Transform(varepsilon, varepsilon_square_equals_0))
+        self.play(TransformMatchingShapes(varepsilon_squared, varepsilon_square_equals_0))
         self.wait(5)
         self.play(
-            Transform(varepsilon, generalised_dual_number)
+            TransformMatchingShapes(varepsilon_square_equals_0, generalised_dual_number)
         )
         self.wait(8)
-        self.play(FadeOut(varepsilon))
+        self.play(FadeOut(generalised_dual_number))
         self.wait(1)
         
-        title_mul = Tex("Multiplication").to_corner(UL).scale(0.9)
-        expr0 = MathTex(r"(3 + 4 \varepsilon)\cdot(2 + 1 \varepsilon)").scale(1.2)
-        self.play(Write(title_mul), Write(expr0))
+        title_mul = Text("Multiplication").to_corner(UL).scale(0.9)
+        expr0 = MTex(r"(3 + 4 \varepsilon)\cdot(2 + 1 \varepsilon)", scale=1.2)
+        # Every step of the working is centred on the same point, worked out once
+        product_center = expr0.get_center()
+        self.show(title_mul, expr0)
         self.wait(5)
 
-        expr1 = MathTex(
+        expr1 = MTex(
             r"(3 + 4 \varepsilon)\cdot(2 + 1 \varepsilon)",
             r"=",
             r"3\cdot 2",
@@ -130,11 +318,11 @@ class DualNumbersAnimation(Scene):
             r"4\varepsilon\cdot 2",
             r"+",
             r"4\varepsilon\cdot 1\varepsilon",
-        ).move_to(expr0)
+        ).move_to(product_center)
         self.play(TransformMatchingTex(expr0, expr1, path_arc=0.2))
         self.wait(2.2)
 
-        expr2 = MathTex(
+        expr2 = MTex(
             r"(3 + 4 \varepsilon)\cdot(2 + 1 \varepsilon)",
             r"=",
             r"6",
@@ -144,11 +332,11 @@ class DualNumbersAnimation(Scene):
             r"8\varepsilon",
             r"+",
             r"4\varepsilon^2",
-        ).move_to(expr1)
+        ).move_to(product_center)
         self.play(TransformMatchingTex(expr1, expr2, path_arc=0.15))
         self.wait(2)
 
-        expr3 = MathTex(
+        expr3 = MTex(
             r"(3 + 4 \varepsilon)\cdot(2 + 1 \varepsilon)",
             r"=",
             r"6",
@@ -156,54 +344,55 @@ class DualNumbersAnimation(Scene):
             r"11\varepsilon",
             r"+",
             r"4\varepsilon^2",
-        ).move_to(expr2)
+        ).move_to(product_center)
         self.play(TransformMatchingTex(expr2, expr3, path_arc=0.1))
         self.wait(2)
 
-        bad_term = expr3.get_part_by_tex(r"4\varepsilon^2")
+        bad_term = expr3[6]
         cross = Cross(bad_term, color=RED, stroke_width=8).scale(1.10)
         self.play(Create(cross))
         self.wait(0.2)
 
-        expr4 = MathTex(
-            r"(3 + 4 \varepsilon)\cdot(2 + 1 \varepsilon)",
-            r"=",
-            r"6 + 11\varepsilon",
-        ).move_to(expr3)
+        # Dropping the crossed out term only removes parts, so the rest is recentred in place
+        product = expr3[:5]
         self.play(
-            TransformMatchingTex(expr3, expr4, path_arc=0.1),
+            FadeOut(expr3[5:]),
+            product.animate.move_to(product_center),
             FadeOut(cross)
         )
         self.wait(0.6)
 
-        self.play(FadeOut(expr4), FadeOut(title_mul))
-        title_div = Tex("Division").to_corner(UL).scale(0.9)
-        div0 = MathTex(r"\frac{1}{a + b \varepsilon}").scale(1.2)
-        self.play(Write(title_div), Write(div0))
+        self.play(FadeOut(product), FadeOut(title_mul))
+        title_div = Text("Division").to_corner(UL).scale(0.9)
+        div0 = MTex(r"\frac{1}{a + b \varepsilon}", scale=1.2)
+        quotient_center = div0.get_center()
+        self.show(title_div, div0)
 
-        div1 = MathTex(
+        div1 = MTex(
             r"\frac{1}{a + b \varepsilon}",
             r"=",
             r"\frac{1}{a + b \varepsilon}\cdot\frac{a - b \varepsilon}{a - b \varepsilon}",
-        ).move_to(div0)
+        ).move_to(quotient_center)
         self.play(TransformMatchingTex(div0, div1, path_arc=0.15))
         self.wait(4)
-        div2 = MathTex(
+        div2 = MTex(
             r"\frac{1}{a + b \varepsilon}",
             r"=",
             r"\frac{a - b \varepsilon}{a^2 - (b \varepsilon)^2}",
-        ).move_to(div1)
+        ).move_to(quotient_center)
         self.play(TransformMatchingTex(div1, div2, path_arc=0.15))
         self.wait(3)
 
-        div3 = MathTex(
+        div3 = MTex(
             r"\frac{1}{a + b \varepsilon}",
             r"=",
             r"\frac{a - b \varepsilon}{a^2}",
-        ).move_to(div2)
+        ).move_to(quotient_center)
         self.play(TransformMatchingTex(div2, div3, path_arc=0.12))
         self.wait(3)
-        note = Tex(r"valid only if $a\neq 0$").scale(0.8).next_to(div3, DOWN)
+        note = VGroup(
+            Text("valid only if"), MTex(r"a \neq 0")
+        ).arrange(RIGHT, buff=0.15).scale(0.8).next_to(div3, DOWN)
         self.play(FadeIn(note, shift=UP*0.2))
 
         self.wait(5)
@@ -216,19 +405,20 @@ class DualNumbersAnimation(Scene):
 
 
     def finding_derivative_2(self):
-        d_def = MathTex(
-            r"\mathbb{D} = \{ a + b \varepsilon \mid a, b \in \mathbb{R} \} = \{ \text{Dual numbers} \}"
-        ).scale(0.9)
-        self.play(Write(d_def))
+        d_def = MTex(
+            r"\mathbb{D} = \{ a + b \varepsilon \mid a, b \in \mathbb{R} \} = \{ \text{Dual numbers} \}",
+            scale=0.9
+        )
+        self.show(d_def)
         self.wait(5.6)
         self.play(FadeOut(d_def))
 
-        f_real = MathTex(
+        f_real = MTex(
             r"f : \mathbb{R} \to \mathbb{R}, \,", r"f(x) = x^2 + 3x + 5"
         ).to_edge(DOWN, buff=3.0)
-        self.play(Write(f_real))
+        self.show(f_real)
         self.wait(2.5)
-        f_dual = MathTex(
+        f_dual = MTex(
             r"f : \mathbb{D} \to \mathbb{D}, \,", r"f(u) = u^2 + 3u + 5"
         ).to_edge(UP, buff=3.0)
         self.play(Transform(f_real, f_dual))
@@ -241,109 +431,128 @@ class DualNumbersAnimation(Scene):
         self.wait(2)
         equation = f_real[1]
 
-        f_input = MathTex(
+        # Only the right hand side changes from here on, so the left hand side stays on screen and
+        # slides into place while each new right hand side is transformed in
+        f_input = MTex(
             r"f(x + \varepsilon) = ", r"(x + \varepsilon)^2 + 3(x + \varepsilon) + 5"
         ).move_to(equation)
-        self.play(Transform(equation, f_input, path_arc=0.2))
+        self.play(ReplacementTransform(equation, f_input, path_arc=0.2))
         self.wait(2)
+        lhs, rhs = f_input
 
-        expand = MathTex(
+        expand = MTex(
             r"f(x + \varepsilon) = ", r"x^2 + 2x\varepsilon + \varepsilon^2 + 3x + 3\varepsilon + 5"
         ).move_to(f_input)
-        self.play(Transform(equation, expand, path_arc=0.15))
+        self.play(
+            lhs.animate.move_to(expand[0]),
+            ReplacementTransform(rhs, expand[1], path_arc=0.15)
+        )
         self.wait(1)
+        rhs = expand[1]
 
-        group_terms = MathTex(
+        group_terms = MTex(
             r"f(x + \varepsilon) = ",
             r"(x^2 + 3x + 5) + (2x + 3)\cdot \varepsilon",
             r"+",
             r"\varepsilon^2"
         )
-        self.play(Transform(equation, group_terms, path_arc=0.12))
+        grouped_rhs = group_terms[1:]
+        self.play(
+            lhs.animate.move_to(group_terms[0]),
+            ReplacementTransform(rhs, grouped_rhs, path_arc=0.12)
+        )
         self.wait(0.5)
+        rhs = grouped_rhs
 
         cross = Cross(group_terms[3], color=RED, stroke_width=8).scale(1.10)
         self.play(Create(cross))
         self.wait(0.5)
 
-        simplified = MathTex(
-            r"f(x + \varepsilon) =", r"(x^2 + 3x + 5) + (2x + 3)\cdot \varepsilon"
-        )
+        # The crossed out term is simply dropped and what is left recentred, no new expression needed
+        simplified = VGroup(lhs, group_terms[1])
         self.play(
             FadeOut(cross), 
-            Transform(equation, equation[0:4], path_arc=0.12)
+            FadeOut(group_terms[2:]),
+            simplified.animate.move_to(ORIGIN)
         )
         self.wait(3)
+        rhs = group_terms[1]
 
-        final = MathTex(
+        final = MTex(
             r"f(x + \varepsilon) =", r"f(x) + f^\prime(x)\,\varepsilon"
         ).move_to(simplified)
-        self.play(Transform(equation, final, path_arc=0.12))
+        self.play(
+            lhs.animate.move_to(final[0]),
+            ReplacementTransform(rhs, final[1], path_arc=0.12)
+        )
         self.wait(10.5)
-        self.play(FadeOut(equation))
+        self.play(FadeOut(lhs, final[1]))
         self.wait(0.5)
 
 
     def exercise_3(self):
         exercise = VGroup(
-            Tex(r"Exercise").scale(0.9).set_color(YELLOW),
-            Tex(r"Show that for any polynomial"),
-            MathTex(r"p(x) &= \sum_{i=0}^n a_i \, x^i"),
-            Tex(r"We have that"),
-            MathTex(r"p(x + \varepsilon) &= p(x) + p'(x)\,\varepsilon")
+            Text("Exercise").scale(0.9).set_color(YELLOW),
+            Text("Show that for any polynomial"),
+            MTex(r"p(x) &= \sum_{i=0}^n a_i \, x^i"),
+            Text("We have that"),
+            MTex(r"p(x + \varepsilon) &= p(x) + p'(x)\,\varepsilon")
         ).arrange(DOWN).to_edge(UP)
         self.play(FadeIn(exercise, aligned_edge=LEFT, shift=DOWN))
         self.wait(8) 
 
-        self.play(
-            FadeOut(exercise)
-        )
-        proof_title = Tex("Proof").to_corner(UL).scale(0.9)
-        self.play(Write(proof_title))
+        proof_title = Text("Proof").to_corner(UL).scale(0.9)
+        self.play(Succession(
+            FadeOut(exercise),
+            write_in(proof_title)
+        ))
 
-        s1 = MathTex(
+        s1 = MTex(
             r"p(x + \varepsilon)", r"=", r"\sum_{i = 0}^n a_i\,(x + \varepsilon)^i"
-        ).scale(1.0).to_edge(UP, buff=2.0)
-        self.play(Write(s1))
+        ).to_edge(UP, buff=2.0)
+        proof_center = s1.get_center()
+        self.show(s1)
         self.wait(0.25)
 
-        s2 = MathTex(
+        s2 = MTex(
             r"p(x + \varepsilon)", r"=",
             r"\sum_{i = 0}^n a_i \sum_{k = 0}^{i} \binom{i}{k} x^{\,i-k}\varepsilon^{k}"
-        ).move_to(s1)
+        ).move_to(proof_center)
         self.play(TransformMatchingTex(s1, s2, path_arc=0.2))
         self.wait(0.25)
 
-        note = Tex(r"$\varepsilon^2 = 0\ \Rightarrow\ k\ge 2 \text{ terms vanish}$").scale(0.7)
+        note = TTex(r"$\varepsilon^2 = 0\ \Rightarrow\ k\ge 2 \text{ terms vanish}$", scale=0.7)
         note.next_to(s2, DOWN, buff=0.25)
-        self.play(FadeIn(note, shift=UP*0.2))
-        self.play(Circumscribe(s2, color=YELLOW, time_width=0.6))
+        self.play(Succession(
+            FadeIn(note, shift=UP*0.2),
+            Circumscribe(s2, color=YELLOW, time_width=0.6)
+        ))
         self.wait(0.2)
 
-        s3 = MathTex(
+        s3 = MTex(
             r"p(x + \varepsilon)", r"=",
             r"\sum_{i = 0}^n a_i \Big(x^i + i\,x^{\,i-1}\varepsilon\Big)"
-        ).move_to(s2)
+        ).move_to(proof_center)
         self.play(TransformMatchingTex(s2, s3, path_arc=0.15), FadeOut(note))
         self.wait(0.25)
 
-        s4 = MathTex(
+        s4 = MTex(
             r"p(x + \varepsilon)", r"=",
             r"\sum_{i=0}^n a_i x^i",
             r"+",
             r"\varepsilon \sum_{i=0}^n i\,a_i\,x^{\,i-1}"
-        ).move_to(s3)
+        ).move_to(proof_center)
         self.play(TransformMatchingTex(s3, s4, path_arc=0.12))
         self.wait(0.25)
 
-        s5 = MathTex(
+        s5 = MTex(
             r"p(x+\varepsilon)", r"=", r"p(x)", r"+", r"p'(x)\,\varepsilon"
-        ).move_to(s4)
+        ).move_to(proof_center)
         self.play(TransformMatchingTex(s4, s5, path_arc=0.12))
         self.play(Indicate(s5[-3], color=BLUE), Indicate(s5[-1], color=BLUE))
         self.wait(0.8)
 
-        qedsym = MathTex(r"\square").scale(0.9).next_to(s5, RIGHT, buff=0.3)
+        qedsym = MTex(r"\square", scale=0.9).next_to(s5, RIGHT, buff=0.3)
         self.play(FadeIn(qedsym, shift=RIGHT*0.2))
         self.wait(0.8)
         self.play(FadeOut(s5), FadeOut(proof_title), FadeOut(qedsym))
\ No newline at end of file